@@ -0,0 +1,242 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError, dataclass
+from fractions import Fraction
+from unittest import TestCase
+
+from zksync_sdk.serializers import WrongValueError
+from zksync_sdk.types import (ChangePubKey, ChangePubKeyCREATE2, ChangePubKeyEcdsa, ForcedExit, MintNFT, NFT, Order,
+                              SignatureType, Swap, Token, Tokens, Transfer, TxEthSignature, TxSignature, Withdraw,
+                              WithdrawNFT)
+
+
+class TokenTest(TestCase):
+    def test_decimal_str_amount(self):
+        token = Token(id=1, symbol='USDC', address='', decimals=6)
+        assert token.decimal_str_amount(0) == "0.0"
+        assert token.decimal_str_amount(1) == "0.000001"
+        assert token.decimal_str_amount(1000000) == "1.0"
+        assert token.decimal_str_amount(1500000) == "1.5"
+        assert token.decimal_str_amount(123456789) == "123.456789"
+        assert Token.eth().decimal_str_amount(10 ** 12) == "0.000001"
+
+    def test_decimal_str_amount_exact(self):
+        # Longer than the 28 significant digits of the default decimal context
+        token = Token(id=1, symbol='USDC', address='', decimals=1)
+        assert token.decimal_str_amount(702863049656976249964616340288338367134) == \
+               "70286304965697624996461634028833836713.4"
+        assert Token.eth().decimal_str_amount(2 ** 128 - 1) == "340282366920938463463.374607431768211455"
+
+    def test_copy_and_pickle(self):
+        token = Token(id=2, symbol='USDC', address='0xeb8f08a975ab53e34d8a0330e0d34de942c95926', decimals=6)
+        assert pickle.loads(pickle.dumps(token)) == token
+        assert copy.copy(token) == token
+        assert copy.deepcopy(token) == token
+
+    def test_deepcopy_transaction(self):
+        tr = Transfer(from_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                      to_address="0x19aa2ed8712072e918632259780e587698ef58df",
+                      token=Token.eth(),
+                      amount=1000000000000, fee=1000000, nonce=12, valid_from=0,
+                      valid_until=4294967295, account_id=44)
+        tr_copy = copy.deepcopy(tr)
+        assert tr_copy == tr
+        assert tr_copy.encoded_message() == tr.encoded_message()
+
+    def test_decimal_str_amount_no_decimals(self):
+        token = Token(id=1, symbol='NFT', address='', decimals=0)
+        assert token.decimal_str_amount(42) == "42.0"
+        assert token.decimal_str_amount(100) == "100.0"
+
+
+class NFTTest(TestCase):
+    def test_parse(self):
+        nft = NFT.parse({
+            "id":             70000,
+            "address":        "0x5ba5a9f53a8c9f1bd4cdc5ed5d1fb6c2fd5c2a1f",
+            "symbol":         "NFT-70000",
+            "creatorId":      44,
+            "contentHash":    "0x0000000000000000000000000000000000000000000000000000000000000123",
+            "creatorAddress": "0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+            "serialId":       1,
+        })
+        assert nft.id == 70000
+        assert nft.decimals == 0
+        assert nft.creator_id == 44
+        assert nft.content_hash == "0x0000000000000000000000000000000000000000000000000000000000000123"
+        assert nft.creator_address == "0xedE35562d3555e61120a151B3c8e8e91d83a378a"
+        assert nft.serial_id == 1
+        assert nft.decimal_str_amount(1) == "1.0"
+
+    def test_decimals_default(self):
+        nft = NFT(id=70000, address="0x5ba5a9f53a8c9f1bd4cdc5ed5d1fb6c2fd5c2a1f", symbol="NFT-70000",
+                  creator_id=44, content_hash="0x00", creator_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                  serial_id=1)
+        assert nft.decimals == 0
+        assert pickle.loads(pickle.dumps(nft)) == nft
+
+
+class TokensTest(TestCase):
+    def test_parse_and_find(self):
+        tokens = Tokens.parse([
+            {"address": "0x0000000000000000000000000000000000000000", "id": 0, "symbol": "ETH", "decimals": 18},
+            {"address": "0xeb8f08a975ab53e34d8a0330e0d34de942c95926", "id": 2, "symbol": "USDC", "decimals": 6},
+        ])
+        assert tokens.find(0) == Token.eth()
+        assert tokens.find("USDC").id == 2
+        assert tokens.find("0xeb8f08a975ab53e34d8a0330e0d34de942c95926").symbol == "USDC"
+        assert tokens.find("DAI") is None
+
+    def test_find_first_wins(self):
+        first = Token(id=1, symbol='USDC', address='0x01', decimals=6)
+        second = Token(id=1, symbol='USDC', address='0x01', decimals=18)
+        tokens = Tokens(tokens=[first, second])
+        assert tokens.find_by_id(1) is first
+        assert tokens.find_by_symbol('USDC') is first
+        assert tokens.find_by_address('0x01') is first
+
+    def test_immutable(self):
+        tokens = Tokens(tokens=[Token.eth()])
+        assert tokens.tokens == (Token.eth(),)
+        with self.assertRaises(FrozenInstanceError):
+            tokens.tokens = ()
+
+
+class ChangePubKeyAuthDataTest(TestCase):
+    def test_dict(self):
+        ecdsa = ChangePubKeyEcdsa(batch_hash=b"\x01" * 32)
+        assert ecdsa.dict("0xsig") == {"type": "ECDSA", "ethSignature": "0xsig", "batchHash": "0x" + "01" * 32}
+        assert ChangePubKeyEcdsa().dict(None)["batchHash"] == "0x" + "00" * 32
+        create2 = ChangePubKeyCREATE2(creator_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                                      salt_arg=b"\x02" * 32, code_hash=b"\x03" * 32)
+        assert create2.dict() == {"type": "CREATE2", "saltArg": "0x" + "02" * 32, "codeHash": "0x" + "03" * 32}
+
+    def test_immutable(self):
+        ecdsa = ChangePubKeyEcdsa()
+        with self.assertRaises(FrozenInstanceError):
+            ecdsa.batch_hash = b"\x01" * 32
+        create2 = ChangePubKeyCREATE2(creator_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                                      salt_arg=b"\x02" * 32, code_hash=b"\x03" * 32)
+        with self.assertRaises(FrozenInstanceError):
+            create2.salt_arg = b"\x04" * 32
+
+    def test_get_auth_data(self):
+        @dataclass(frozen=True)
+        class CustomEcdsa(ChangePubKeyEcdsa):
+            pass
+
+        create2 = ChangePubKeyCREATE2(creator_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                                      salt_arg=b"\x02" * 32, code_hash=b"\x03" * 32)
+        cases = (
+            (None, {"type": "Onchain"}),
+            (ChangePubKeyEcdsa(), ChangePubKeyEcdsa().dict("0xsig")),
+            (create2, create2.dict()),
+            (CustomEcdsa(batch_hash=b"\x01" * 32), ChangePubKeyEcdsa(batch_hash=b"\x01" * 32).dict("0xsig")),
+        )
+        for eth_auth_data, expected in cases:
+            tx = ChangePubKey(account_id=44, account="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                              new_pk_hash="sync:18e8446d7748f2de52b28345bdbc76574e6b35b9", token=Token.eth(),
+                              fee=0, nonce=0, valid_from=0, valid_until=4294967295, eth_auth_data=eth_auth_data)
+            assert tx.get_auth_data("0xsig") == expected, eth_auth_data
+
+
+class EncodedTxTest(TestCase):
+    def test_header_matches_tx_type(self):
+        # Listed explicitly: with slots=True, __subclasses__() can still hold the replaced classes.
+        for tx_class in (ChangePubKey, Transfer, Withdraw, ForcedExit, Swap, MintNFT, WithdrawNFT):
+            assert tx_class._HEADER == bytes([0xff - tx_class._TX_TYPE, 0x01]), tx_class.__name__
+            assert tx_class.__new__(tx_class).tx_type() == tx_class._TX_TYPE, tx_class.__name__
+
+
+class TransactionCacheTest(TestCase):
+    def make_transfer(self) -> Transfer:
+        return Transfer(from_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                        to_address="0x19aa2ed8712072e918632259780e587698ef58df",
+                        token=Token.eth(),
+                        amount=1000000000000, fee=1000000, nonce=12, valid_from=0,
+                        valid_until=4294967295, account_id=44)
+
+    def test_invalid_address_rejected_on_construction(self):
+        for address in ("", "19aa2ed8712072e918632259780e587698ef58df", "0x19aa2e", "0xzz"):
+            with self.assertRaises(WrongValueError):
+                Transfer(from_address="0xedE35562d3555e61120a151B3c8e8e91d83a378a",
+                         to_address=address,
+                         token=Token.eth(),
+                         amount=1000000000000, fee=1000000, nonce=12, valid_from=0,
+                         valid_until=4294967295, account_id=44)
+
+    def test_messages_are_memoized(self):
+        tr = self.make_transfer()
+        assert tr.encoded_message() is tr.encoded_message()
+        assert tr.human_readable_message() is tr.human_readable_message()
+
+    def test_signature_keeps_cache(self):
+        tr = self.make_transfer()
+        encoded = tr.encoded_message()
+        tr.signature = None
+        assert tr.encoded_message() is encoded
+
+    def test_field_change_resets_cache(self):
+        tr = self.make_transfer()
+        encoded = tr.encoded_message()
+        message = tr.human_readable_message()
+        tr.fee = 2000000
+        tr.to_address = "0x823b6a996cea19e0c41e250b20e2e804ea72ccdf"
+        assert tr.encoded_message() == self.encode_transfer_with(
+            fee=2000000, to_address="0x823b6a996cea19e0c41e250b20e2e804ea72ccdf")
+        assert tr.encoded_message() != encoded
+        assert tr.human_readable_message() != message
+
+    def test_rejected_field_change_keeps_transaction(self):
+        tr = self.make_transfer()
+        encoded = tr.encoded_message()
+        message = tr.human_readable_message()
+        with self.assertRaises(WrongValueError):
+            tr.to_address = "0xnothex"
+        assert tr.to_address == "0x19aa2ed8712072e918632259780e587698ef58df"
+        assert tr.encoded_message() == encoded
+        assert tr.human_readable_message() == message
+        tr.fee = 2000000
+        assert tr.encoded_message() == self.encode_transfer_with(fee=2000000)
+
+    def test_copy_keeps_hook(self):
+        tr = self.make_transfer()
+        encoded = tr.encoded_message()
+        for tr_copy in (copy.copy(tr), pickle.loads(pickle.dumps(tr))):
+            assert tr_copy == tr
+            assert tr_copy.encoded_message() == encoded
+            tr_copy.fee = 2000000
+            assert tr_copy.encoded_message() == self.encode_transfer_with(fee=2000000)
+        assert tr.encoded_message() is encoded
+        with self.assertRaises(TypeError):
+            hash(tr)
+
+    def encode_transfer_with(self, **changes) -> bytes:
+        tr = self.make_transfer()
+        fields = {name: getattr(tr, name) for name in ("account_id", "from_address", "to_address", "token",
+                                                       "amount", "fee", "nonce", "valid_from", "valid_until")}
+        fields.update(changes)
+        return Transfer(**fields).encoded_message()
+
+
+class OrderTest(TestCase):
+    def test_out_of_range_ratio(self):
+        for ratio in (Fraction(2 ** 121), Fraction(-1, 3)):
+            order = Order(account_id=6, nonce=18, token_sell=Token.eth(), token_buy=Token.eth(),
+                          ratio=ratio, amount=1000000,
+                          recipient='0x823b6a996cea19e0c41e250b20e2e804ea72ccdf',
+                          valid_from=0, valid_until=4294967295)
+            with self.assertRaises(WrongValueError):
+                order.encoded_message()
+
+    def test_set_signatures(self):
+        order = Order(account_id=6, nonce=18, token_sell=Token.eth(), token_buy=Token.eth(),
+                      ratio=Fraction(1, 2), amount=1000000,
+                      recipient='0x823b6a996cea19e0c41e250b20e2e804ea72ccdf',
+                      valid_from=0, valid_until=4294967295)
+        encoded = order.encoded_message()
+        order.signature = TxSignature(public_key=b"\x01" * 32, signature=b"\x02" * 64)
+        order.ethSignature = TxEthSignature(type=SignatureType.ethereum_signature, signature=b"\x03" * 65)
+        assert order.encoded_message() is encoded
+        assert order.dict()["signature"] == {"pubKey": "01" * 32, "signature": "02" * 64}
+        assert order.dict()["ethSignature"] == {"type": "EthereumSignature", "signature": "03" * 65}
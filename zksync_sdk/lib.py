@@ -1,6 +1,7 @@
 import ctypes
 from ctypes import (Structure, c_ubyte, cdll)
 import os
+from typing import Union
 
 PRIVATE_KEY_LEN = 32
 PUBLIC_KEY_LEN = 32
@@ -79,11 +80,10 @@ class ZkSyncLibrary:
         self.lib.zks_crypto_sign_musig(private_key, message, len(message), signature)
         return bytes(signature.contents.data)
 
-    def hash_orders(self, orders: bytes):
+    def hash_orders(self, orders: Union[bytes, bytearray]):
         assert len(orders) == ORDER_LEN * 2
         orders_hash = ctypes.pointer(ZksOrdersHash())
-        orders_bytes = ctypes.pointer(
-            ZksOrders(data=(c_ubyte * (ORDER_LEN * 2))(*orders)))
+        orders_bytes = ctypes.pointer(ZksOrders.from_buffer_copy(orders))
         self.lib.rescue_hash_orders(orders_bytes, len(orders), orders_hash)
         return bytes(orders_hash.contents.data)
 
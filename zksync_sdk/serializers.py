@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 from fractions import Fraction
 
 AMOUNT_EXPONENT_BIT_WIDTH = 5
@@ -7,6 +7,7 @@ FEE_EXPONENT_BIT_WIDTH = 5
 FEE_MANTISSA_BIT_WIDTH = 11
 MAX_NUMBER_OF_ACCOUNTS = 2 ** 24
 MAX_NUMBER_OF_TOKENS = 2 ** 32 - 1
+MAX_RATIO_PART = 2 ** 120 - 1
 
 
 class SerializationError(Exception):
@@ -41,7 +42,7 @@ def num_to_bits(integer: int, bits: int):
     return results
 
 
-def integer_to_float(integer: int, exp_bits: int, mantissa_bits: int, exp_base: int) -> List[int]:
+def float_parts(integer: int, exp_bits: int, mantissa_bits: int, exp_base: int) -> Tuple[int, int]:
     max_exponent_power = 2 ** exp_bits - 1
     max_exponent = exp_base ** max_exponent_power
     max_mantissa = 2 ** mantissa_bits - 1
@@ -63,6 +64,12 @@ def integer_to_float(integer: int, exp_bits: int, mantissa_bits: int, exp_base:
             mantissa = max_mantissa
             exponent -= 1
 
+    return mantissa, exponent
+
+
+def integer_to_float(integer: int, exp_bits: int, mantissa_bits: int, exp_base: int) -> List[int]:
+    mantissa, exponent = float_parts(integer, exp_bits, mantissa_bits, exp_base)
+
     data = []
     data.extend(num_to_bits(exponent, exp_bits))
     data.extend(num_to_bits(mantissa, mantissa_bits))
@@ -156,28 +163,35 @@ def closest_packable_transaction_fee(fee: int) -> int:
     )
 
 
-def packed_fee_checked(fee: int):
-    if closest_packable_transaction_fee(fee) != fee:
+def _packed_float_checked(value: int, exp_bits: int, mantissa_bits: int) -> bytes:
+    # Same layout as `integer_to_float`, but built from integers: mantissa bits
+    # followed by exponent bits, big-endian.
+    if value < 0:
+        raise ValueNotPackedError
+    mantissa, exponent = float_parts(value, exp_bits, mantissa_bits, 10)
+    if mantissa * 10 ** exponent != value:
         raise ValueNotPackedError
-    return pack_fee(fee)
+    return ((mantissa << exp_bits) | exponent).to_bytes((exp_bits + mantissa_bits) // 8, 'big')
+
+
+def packed_fee_checked(fee: int):
+    return _packed_float_checked(fee, FEE_EXPONENT_BIT_WIDTH, FEE_MANTISSA_BIT_WIDTH)
 
 
 def packed_amount_checked(amount: int):
-    if closest_packable_amount(amount) != amount:
-        raise ValueNotPackedError
-    return pack_amount(amount)
+    return _packed_float_checked(amount, AMOUNT_EXPONENT_BIT_WIDTH, AMOUNT_MANTISSA_BIT_WIDTH)
 
 
 def serialize_nonce(nonce: int):
     if nonce < 0:
         raise WrongValueError
-    return int_to_bytes(nonce, 4)
+    return nonce.to_bytes(4, 'big')
 
 
 def serialize_timestamp(timestamp: int):
     if timestamp < 0:
         raise WrongValueError
-    return b"\x00" * 4 + int_to_bytes(timestamp, 4)
+    return b"\x00" * 4 + timestamp.to_bytes(4, 'big')
 
 
 def serialize_token_id(token_id: int):
@@ -185,7 +199,7 @@ def serialize_token_id(token_id: int):
         raise WrongValueError
     if token_id > MAX_NUMBER_OF_TOKENS:
         raise WrongValueError
-    return int_to_bytes(token_id, 4)
+    return token_id.to_bytes(4, 'big')
 
 
 def serialize_account_id(account_id: int):
@@ -193,7 +207,7 @@ def serialize_account_id(account_id: int):
         raise WrongValueError
     if account_id > MAX_NUMBER_OF_ACCOUNTS:
         raise WrongValueError
-    return int_to_bytes(account_id, 4)
+    return account_id.to_bytes(4, 'big')
 
 
 def remove_address_prefix(address: str) -> str:
@@ -206,7 +220,12 @@ def remove_address_prefix(address: str) -> str:
 
 def serialize_address(address: str) -> bytes:
     address = remove_address_prefix(address)
-    address_bytes = bytes.fromhex(address)
+    if address is None:
+        raise WrongValueError
+    try:
+        address_bytes = bytes.fromhex(address)
+    except ValueError as e:
+        raise WrongValueError from e
     if len(address_bytes) != 20:
         raise WrongValueError
     return address_bytes
@@ -217,5 +236,9 @@ def serialize_content_hash(content_hash: str) -> bytes:
     return bytes.fromhex(content_hash)
 
 def serialize_ratio_part(part: int) -> bytes:
+    if part < 0:
+        raise WrongValueError
+    if part > MAX_RATIO_PART:
+        raise WrongValueError
     # turn the number into bytes and 0-pad to length 15
-    return bytes.fromhex(hex(part)[2:].zfill(15*2))
+    return part.to_bytes(15, 'big')
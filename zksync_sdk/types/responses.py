@@ -1,6 +1,7 @@
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 from decimal import Decimal
-from zksync_sdk.types.transactions import Token
+from zksync_sdk.types.transactions import _SLOTS, Token
 
 from pydantic import BaseModel
 
@@ -21,19 +22,40 @@ class Balance(BaseModel):
 class Depositing(BaseModel):
     balances: Dict[str, Balance]
 
+@dataclass(frozen=True, init=False, **_SLOTS)
 class NFT(Token):
     creator_id: int
     content_hash: str
     creator_address: str
     serial_id: int
-    decimals = 0
+
+    # Keyword-only like the former pydantic model, with `decimals` defaulting to 0.
+    # Fields are snake_case; use `parse` for camelCase server payloads.
+    def __init__(self, *, address: str, id: int, symbol: str, creator_id: int,
+                 content_hash: str, creator_address: str, serial_id: int, decimals: int = 0):
+        object.__setattr__(self, "address", address)
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "symbol", symbol)
+        object.__setattr__(self, "decimals", decimals)
+        object.__setattr__(self, "creator_id", creator_id)
+        object.__setattr__(self, "content_hash", content_hash)
+        object.__setattr__(self, "creator_address", creator_address)
+        object.__setattr__(self, "serial_id", serial_id)
+
+    @classmethod
+    def parse(cls, data: dict) -> "NFT":
+        return cls(address=data["address"],
+                   id=data["id"],
+                   symbol=data["symbol"],
+                   decimals=data.get("decimals", 0),
+                   creator_id=data["creatorId"],
+                   content_hash=data["contentHash"],
+                   creator_address=data["creatorAddress"],
+                   serial_id=data["serialId"])
 
     def decimal_amount(self, amount: int) -> Decimal:
         return Decimal(amount)
 
-    class Config:
-        alias_generator = to_camel
-
 class State(BaseModel):
     nonce: int
     pub_key_hash: str
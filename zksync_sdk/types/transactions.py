@@ -1,14 +1,14 @@
 import abc
-from dataclasses import dataclass
+import struct
+import sys
+from dataclasses import dataclass, field
 from decimal import Decimal
 from fractions import Fraction
 from enum import Enum
-from typing import List, Optional, Union, Tuple
+from typing import TYPE_CHECKING, ClassVar, Dict, Iterable, List, Optional, Sequence, Union, Tuple
 
-from pydantic import BaseModel
-
-from zksync_sdk.lib import ZkSyncLibrary
-from zksync_sdk.serializers import (int_to_bytes, packed_amount_checked, packed_fee_checked,
+from zksync_sdk.lib import ORDER_LEN, ZkSyncLibrary
+from zksync_sdk.serializers import (WrongValueError, packed_amount_checked, packed_fee_checked,
                                     serialize_account_id,
                                     serialize_address, serialize_content_hash,
                                     serialize_nonce, serialize_timestamp,
@@ -21,6 +21,18 @@ TokenLike = Union[str, int]
 
 TRANSACTION_VERSION = 0x01
 
+# dataclass(slots=True) is available from Python 3.10 on
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_zks_lib: Optional[ZkSyncLibrary] = None
+
+
+def _get_lib() -> ZkSyncLibrary:
+    global _zks_lib
+    if _zks_lib is None:
+        _zks_lib = ZkSyncLibrary()
+    return _zks_lib
+
 
 class ChangePubKeyTypes(Enum):
     onchain = "Onchain"
@@ -35,46 +47,70 @@ class RatioType(Enum):
     token = 'Token'
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ChangePubKeyEcdsa:
     batch_hash: bytes = b"\x00" * 32
 
+    _batch_hash_hex: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_batch_hash_hex", "0x" + self.batch_hash.hex())
+
     def encode_message(self):
         return self.batch_hash
 
     def dict(self, signature: str):
         return {"type":         "ECDSA",
                 "ethSignature": signature,
-                "batchHash":    f"0x{self.batch_hash.hex()}"}
+                "batchHash":    self._batch_hash_hex}
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ChangePubKeyCREATE2:
     creator_address: str
     salt_arg: bytes
     code_hash: bytes
 
+    _salt_arg_hex: str = field(init=False, repr=False, compare=False)
+    _code_hash_hex: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_salt_arg_hex", "0x" + self.salt_arg.hex())
+        object.__setattr__(self, "_code_hash_hex", "0x" + self.code_hash.hex())
+
     def encode_message(self):
         return self.salt_arg
 
     def dict(self):
         return {"type":     "CREATE2",
-                "saltArg":  f"0x{self.salt_arg.hex()}",
-                "codeHash": f"0x{self.code_hash.hex()}"}
+                "saltArg":  self._salt_arg_hex,
+                "codeHash": self._code_hash_hex}
 
 
-class Token(BaseModel):
+@dataclass(frozen=True, **_SLOTS)
+class Token:
     address: str
     id: int
     symbol: str
     decimals: int
 
+    _ETH: ClassVar[Optional["Token"]] = None
+
+    @classmethod
+    def parse(cls, data: dict) -> "Token":
+        return cls(address=data["address"],
+                   id=data["id"],
+                   symbol=data["symbol"],
+                   decimals=data["decimals"])
+
     @classmethod
     def eth(cls):
-        return cls(id=0,
-                   address=DEFAULT_TOKEN_ADDRESS,
-                   symbol="ETH",
-                   decimals=18)
+        if cls._ETH is None:
+            cls._ETH = cls(id=0,
+                           address=DEFAULT_TOKEN_ADDRESS,
+                           symbol="ETH",
+                           decimals=18)
+        return cls._ETH
 
     def is_eth(self) -> bool:
         return self.symbol == "ETH" and self.address == DEFAULT_TOKEN_ADDRESS
@@ -86,46 +122,54 @@ class Token(BaseModel):
         return int(amount.scaleb(self.decimals))
 
     def decimal_str_amount(self, amount: int) -> str:
-        d = self.decimal_amount(amount)
-        
-        # Creates a string with `self.decimals` numbers after decimal point.
-        # Prevents scientific notation (string values like '1E-8').
-        # Prevents integral numbers having no decimal point in the string representation.
-        d_str = f"{d:.{self.decimals}f}"
-
-        d_str = d_str.rstrip("0")
-        if d_str[-1] == ".":
-            return d_str + "0"
+        if amount < 0:
+            return "-" + self.decimal_str_amount(-amount)
+        if self.decimals == 0:
+            return f"{amount}.0"
+
+        # Splits the integer digits at `self.decimals` instead of going through Decimal,
+        # so there is no scientific notation and integral numbers keep a trailing '.0'.
+        digits = str(amount).zfill(self.decimals + 1)
+        fraction = digits[-self.decimals:].rstrip("0") or "0"
+        return f"{digits[:-self.decimals]}.{fraction}"
+
+
+@dataclass(frozen=True)
+class Tokens:
+    tokens: Sequence[Token]
+
+    _by_address: Dict[str, Token] = field(init=False, repr=False, compare=False)
+    _by_id: Dict[int, Token] = field(init=False, repr=False, compare=False)
+    _by_symbol: Dict[str, Token] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Tokens is immutable, so the indexes below can never go stale
+        tokens = tuple(self.tokens)
+        by_address: Dict[str, Token] = {}
+        by_id: Dict[int, Token] = {}
+        by_symbol: Dict[str, Token] = {}
+        # Iterate in reverse so the first token wins on duplicate keys, as with a linear scan
+        for token in reversed(tokens):
+            by_address[token.address] = token
+            by_id[token.id] = token
+            by_symbol[token.symbol] = token
+        object.__setattr__(self, "tokens", tokens)
+        object.__setattr__(self, "_by_address", by_address)
+        object.__setattr__(self, "_by_id", by_id)
+        object.__setattr__(self, "_by_symbol", by_symbol)
 
-        if '.' not in d_str:
-            return d_str + '.0'
-
-        return d_str
-
-
-class Tokens(BaseModel):
-    tokens: List[Token]
+    @classmethod
+    def parse(cls, data: Iterable[dict]) -> "Tokens":
+        return cls(tokens=[Token.parse(token) for token in data])
 
     def find_by_address(self, address: str) -> Optional[Token]:
-        found_token = [token for token in self.tokens if token.address == address]
-        if found_token:
-            return found_token[0]
-        else:
-            return None
+        return self._by_address.get(address)
 
     def find_by_id(self, token_id: int) -> Optional[Token]:
-        found_token = [token for token in self.tokens if token.id == token_id]
-        if found_token:
-            return found_token[0]
-        else:
-            return None
+        return self._by_id.get(token_id)
 
     def find_by_symbol(self, symbol: str) -> Optional[Token]:
-        found_token = [token for token in self.tokens if token.symbol == symbol]
-        if found_token:
-            return found_token[0]
-        else:
-            return None
+        return self._by_symbol.get(symbol)
 
     def find(self, token: TokenLike) -> Token:
         result = None
@@ -139,7 +183,52 @@ class Tokens(BaseModel):
         return result
 
 
-class EncodedTx(abc.ABC):
+class _MessageCache:
+    # Transactions memoize `_encoded` and `_human_readable`. Assigning a public field
+    # after construction re-runs __post_init__ to re-derive the decoded address bytes,
+    # then drops the memoized messages. Signatures are not part of the message.
+    # If the new value is rejected, the old one is restored and the caches stay valid.
+    __slots__ = ()
+
+    _UNENCODED_FIELDS: ClassVar[frozenset] = frozenset({"signature", "eth_signature", "ethSignature",
+                                                        "eth_auth_data"})
+
+    def __setattr__(self, name, value):
+        if name[0] == "_" or name in self._UNENCODED_FIELDS:
+            object.__setattr__(self, name, value)
+            return
+        old_value = getattr(self, name)
+        object.__setattr__(self, name, value)
+        try:
+            self.__post_init__()
+        except Exception:
+            object.__setattr__(self, name, old_value)
+            raise
+        object.__setattr__(self, "_encoded", None)
+        object.__setattr__(self, "_human_readable", None)
+
+
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+
+    # Type checkers see a plain mutable dataclass, which is how instances behave.
+    @dataclass_transform()
+    def _message_dataclass(cls): ...
+else:
+    def _message_dataclass(cls):
+        # Generated as a frozen dataclass only for its __init__, which stores fields with
+        # object.__setattr__ and so never goes through the _MessageCache hook. Instances
+        # stay mutable and unhashable like a regular dataclass.
+        cls = dataclass(frozen=True, **_SLOTS)(cls)
+        cls.__setattr__ = _MessageCache.__setattr__
+        cls.__delattr__ = object.__delattr__
+        cls.__hash__ = None
+        return cls
+
+
+class EncodedTx(_MessageCache, abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def encoded_message(self) -> bytes:
         pass
@@ -157,8 +246,18 @@ class EncodedTx(abc.ABC):
         pass
 
 
-@dataclass
+_AUTH_DATA_BUILDERS = {
+    type(None):          lambda auth_data, signature: {"type": "Onchain"},
+    ChangePubKeyEcdsa:   lambda auth_data, signature: auth_data.dict(signature),
+    ChangePubKeyCREATE2: lambda auth_data, signature: auth_data.dict(),
+}
+
+
+@_message_dataclass
 class ChangePubKey(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 7
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     account_id: int
     account: str
     new_pk_hash: str
@@ -171,29 +270,42 @@ class ChangePubKey(EncodedTx):
     eth_signature: TxEthSignature = None
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _account_bytes: bytes = field(init=False, repr=False, compare=False)
+    _new_pk_hash_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._account_bytes = serialize_address(self.account)
+        self._new_pk_hash_bytes = serialize_address(self.new_pk_hash)
+
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         message = f"Set signing key: {self.new_pk_hash.replace('sync:', '').lower()}"
         if self.fee:
             message += f"\nFee: {self.fee} {self.token.symbol}"
-        return message
+        self._human_readable = message
+        return self._human_readable
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.account_id),
-            serialize_address(self.account),
-            serialize_address(self.new_pk_hash),
-            serialize_token_id(self.token.id),
-            packed_fee_checked(self.fee),
-            serialize_nonce(self.nonce),
-            serialize_timestamp(self.valid_from),
-            serialize_timestamp(self.valid_until)
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.account_id)
+        buf += self._account_bytes
+        buf += self._new_pk_hash_bytes
+        buf += serialize_token_id(self.token.id)
+        buf += packed_fee_checked(self.fee)
+        buf += serialize_nonce(self.nonce)
+        buf += serialize_timestamp(self.valid_from)
+        buf += serialize_timestamp(self.valid_until)
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def get_eth_tx_bytes(self) -> bytes:
         data = b"".join([
-            serialize_address(self.new_pk_hash),
+            self._new_pk_hash_bytes,
             serialize_nonce(self.nonce),
             serialize_account_id(self.account_id),
         ])
@@ -202,12 +314,11 @@ class ChangePubKey(EncodedTx):
         return data
 
     def get_auth_data(self, signature: str):
-        if self.eth_auth_data is None:
-            return {"type": "Onchain"}
-        elif isinstance(self.eth_auth_data, ChangePubKeyEcdsa):
-            return self.eth_auth_data.dict(signature)
-        elif isinstance(self.eth_auth_data, ChangePubKeyCREATE2):
-            return self.eth_auth_data.dict()
+        # Exact types hit on the first lookup; the MRO walk keeps subclasses working
+        for auth_type in type(self.eth_auth_data).__mro__:
+            build = _AUTH_DATA_BUILDERS.get(auth_type)
+            if build is not None:
+                return build(self.eth_auth_data, signature)
 
     def dict(self):
         return {
@@ -226,11 +337,14 @@ class ChangePubKey(EncodedTx):
 
     @classmethod
     def tx_type(cls):
-        return 7
+        return cls._TX_TYPE
 
 
-@dataclass
+@_message_dataclass
 class Transfer(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 5
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     account_id: int
     from_address: str
     to_address: str
@@ -242,10 +356,21 @@ class Transfer(EncodedTx):
     valid_until: int
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _from_bytes: bytes = field(init=False, repr=False, compare=False)
+    _to_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._from_bytes = serialize_address(self.from_address)
+        self._to_bytes = serialize_address(self.to_address)
+
     def tx_type(self) -> int:
-        return 5
+        return self._TX_TYPE
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         msg = ""
 
         if self.amount != 0:
@@ -253,22 +378,24 @@ class Transfer(EncodedTx):
         if self.fee != 0:
             msg += f"Fee: {self.token.decimal_str_amount(self.fee)} {self.token.symbol}\n"
         
-        return msg + f"Nonce: {self.nonce}"
+        self._human_readable = msg + f"Nonce: {self.nonce}"
+        return self._human_readable
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.account_id),
-            serialize_address(self.from_address),
-            serialize_address(self.to_address),
-            serialize_token_id(self.token.id),
-            packed_amount_checked(self.amount),
-            packed_fee_checked(self.fee),
-            serialize_nonce(self.nonce),
-            serialize_timestamp(self.valid_from),
-            serialize_timestamp(self.valid_until)
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.account_id)
+        buf += self._from_bytes
+        buf += self._to_bytes
+        buf += serialize_token_id(self.token.id)
+        buf += packed_amount_checked(self.amount)
+        buf += packed_fee_checked(self.fee)
+        buf += serialize_nonce(self.nonce)
+        buf += serialize_timestamp(self.valid_from)
+        buf += serialize_timestamp(self.valid_until)
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def dict(self):
         return {
@@ -286,8 +413,11 @@ class Transfer(EncodedTx):
         }
 
 
-@dataclass
+@_message_dataclass
 class Withdraw(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 3
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     account_id: int
     from_address: str
     to_address: str
@@ -299,32 +429,45 @@ class Withdraw(EncodedTx):
     token: Token
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _from_bytes: bytes = field(init=False, repr=False, compare=False)
+    _to_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._from_bytes = serialize_address(self.from_address)
+        self._to_bytes = serialize_address(self.to_address)
+
     def tx_type(self) -> int:
-        return 3
+        return self._TX_TYPE
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         msg = ""
 
         if self.amount != 0:
             msg += f"Withdraw {self.token.decimal_str_amount(self.amount)} {self.token.symbol} to: {self.to_address.lower()}\n"
         if self.fee != 0:
             msg += f"Fee: {self.token.decimal_str_amount(self.fee)} {self.token.symbol}\n"
-        return msg + f"Nonce: {self.nonce}"
+        self._human_readable = msg + f"Nonce: {self.nonce}"
+        return self._human_readable
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.account_id),
-            serialize_address(self.from_address),
-            serialize_address(self.to_address),
-            serialize_token_id(self.token.id),
-            int_to_bytes(self.amount, length=16),
-            packed_fee_checked(self.fee),
-            serialize_nonce(self.nonce),
-            serialize_timestamp(self.valid_from),
-            serialize_timestamp(self.valid_until)
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.account_id)
+        buf += self._from_bytes
+        buf += self._to_bytes
+        buf += serialize_token_id(self.token.id)
+        buf += self.amount.to_bytes(16, 'big')
+        buf += packed_fee_checked(self.fee)
+        buf += serialize_nonce(self.nonce)
+        buf += serialize_timestamp(self.valid_from)
+        buf += serialize_timestamp(self.valid_until)
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def dict(self):
         return {
@@ -342,8 +485,11 @@ class Withdraw(EncodedTx):
         }
 
 
-@dataclass
+@_message_dataclass
 class ForcedExit(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 8
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     initiator_account_id: int
     target: str
     token: Token
@@ -353,25 +499,36 @@ class ForcedExit(EncodedTx):
     valid_until: int
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _target_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._target_bytes = serialize_address(self.target)
+
     def tx_type(self) -> int:
-        return 8
+        return self._TX_TYPE
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.initiator_account_id),
-            serialize_address(self.target),
-            serialize_token_id(self.token.id),
-            packed_fee_checked(self.fee),
-            serialize_nonce(self.nonce),
-            serialize_timestamp(self.valid_from),
-            serialize_timestamp(self.valid_until)
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.initiator_account_id)
+        buf += self._target_bytes
+        buf += serialize_token_id(self.token.id)
+        buf += packed_fee_checked(self.fee)
+        buf += serialize_nonce(self.nonce)
+        buf += serialize_timestamp(self.valid_from)
+        buf += serialize_timestamp(self.valid_until)
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         message = f"ForcedExit {self.token.symbol} to: {self.target.lower()}\nFee: {self.token.decimal_str_amount(self.fee)} {self.token.symbol}\nNonce: {self.nonce}"
-        return message
+        self._human_readable = message
+        return self._human_readable
 
     def dict(self):
         return {
@@ -386,8 +543,14 @@ class ForcedExit(EncodedTx):
             "validUntil":         self.valid_until,
         }
 
-@dataclass
-class Order:
+@_message_dataclass
+class Order(_MessageCache):
+    _MSG_TYPE: ClassVar[int] = b'o'[0]
+    _HEADER: ClassVar[bytes] = bytes([_MSG_TYPE, TRANSACTION_VERSION])
+    # header, account id, recipient, nonce, sell/buy token ids, ratio, packed amount,
+    # valid_from and valid_until as zero-padded 8-byte timestamps
+    _LAYOUT: ClassVar[struct.Struct] = struct.Struct(">2s4s20sIII15s15s5s4xI4xI")
+
     account_id: int
     recipient: str
     nonce: int
@@ -400,26 +563,51 @@ class Order:
     signature: TxSignature = None
     ethSignature: TxEthSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _recipient_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._recipient_bytes = serialize_address(self.recipient)
+
     def msg_type(self) -> int:
-        return b'o'[0]
+        return self._MSG_TYPE
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(self.msg_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.account_id),
-            serialize_address(self.recipient),
-            serialize_nonce(self.nonce),
-            serialize_token_id(self.token_sell.id),
-            serialize_token_id(self.token_buy.id),
-            serialize_ratio_part(self.ratio.numerator),
-            serialize_ratio_part(self.ratio.denominator),
-            packed_amount_checked(self.amount),
-            serialize_timestamp(self.valid_from),
-            serialize_timestamp(self.valid_until)
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        self._encoded = self._pack(self._LAYOUT.pack)
+        return self._encoded
+
+    def encode_into(self, buf: bytearray, offset: int) -> int:
+        if self._encoded is not None:
+            buf[offset:offset + self._LAYOUT.size] = self._encoded
+        else:
+            self._pack(self._LAYOUT.pack_into, buf, offset)
+        return offset + self._LAYOUT.size
+
+    def _pack(self, pack, *target):
+        try:
+            return pack(
+                *target,
+                self._HEADER,
+                serialize_account_id(self.account_id),
+                self._recipient_bytes,
+                self.nonce,
+                self.token_sell.id,
+                self.token_buy.id,
+                serialize_ratio_part(self.ratio.numerator),
+                serialize_ratio_part(self.ratio.denominator),
+                packed_amount_checked(self.amount),
+                self.valid_from,
+                self.valid_until,
+            )
+        except struct.error as e:
+            raise WrongValueError from e
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         if self.amount == 0:
             header = f'Limit order for {self.token_sell.symbol} -> {self.token_buy.symbol}'
         else:
@@ -432,7 +620,8 @@ class Order:
             f'Address: {self.recipient.lower()}',
             f'Nonce: {self.nonce}'
         ])
-        return message
+        self._human_readable = message
+        return self._human_readable
 
     def dict(self):
         return {
@@ -449,8 +638,11 @@ class Order:
             "ethSignature":     self.ethSignature.dict() if self.ethSignature else None,
         }
 
-@dataclass
+@_message_dataclass
 class Swap(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 11
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     submitter_id: int
     submitter_address: str
     amounts: Tuple[int, int]
@@ -460,34 +652,44 @@ class Swap(EncodedTx):
     nonce: int
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _submitter_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._submitter_bytes = serialize_address(self.submitter_address)
+
     def tx_type(self) -> int:
-        return 11
+        return self._TX_TYPE
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         if self.fee != 0:
             message =  f'Swap fee: {self.fee_token.decimal_str_amount(self.fee)} {self.fee_token.symbol}\n'
         else:
             message = ''
         message += f'Nonce: {self.nonce}'
-        return message
+        self._human_readable = message
+        return self._human_readable
 
     def encoded_message(self) -> bytes:
-        order_bytes = b''.join([
-            self.orders[0].encoded_message(),
-            self.orders[1].encoded_message(),
-        ])
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.submitter_id),
-            serialize_address(self.submitter_address),
-            serialize_nonce(self.nonce),
-            ZkSyncLibrary().hash_orders(order_bytes),
-            serialize_token_id(self.fee_token.id),
-            packed_fee_checked(self.fee),
-            packed_amount_checked(self.amounts[0]),
-            packed_amount_checked(self.amounts[1]),
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        order_bytes = bytearray(2 * ORDER_LEN)
+        offset = self.orders[0].encode_into(order_bytes, 0)
+        self.orders[1].encode_into(order_bytes, offset)
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.submitter_id)
+        buf += self._submitter_bytes
+        buf += serialize_nonce(self.nonce)
+        buf += _get_lib().hash_orders(order_bytes)
+        buf += serialize_token_id(self.fee_token.id)
+        buf += packed_fee_checked(self.fee)
+        buf += packed_amount_checked(self.amounts[0])
+        buf += packed_amount_checked(self.amounts[1])
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def dict(self):
         return {
@@ -502,8 +704,11 @@ class Swap(EncodedTx):
             "orders":           (self.orders[0].dict(), self.orders[1].dict())
         }
 
-@dataclass
+@_message_dataclass
 class MintNFT(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 9
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     creator_id: int
     creator_address: str
     content_hash: str
@@ -513,25 +718,38 @@ class MintNFT(EncodedTx):
     nonce: int
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _creator_bytes: bytes = field(init=False, repr=False, compare=False)
+    _recipient_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._creator_bytes = serialize_address(self.creator_address)
+        self._recipient_bytes = serialize_address(self.recipient)
+
     def tx_type(self) -> int:
-        return 9
+        return self._TX_TYPE
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.creator_id),
-            serialize_address(self.creator_address),
-            serialize_content_hash(self.content_hash),
-            serialize_address(self.recipient),
-            serialize_token_id(self.fee_token.id),
-            packed_fee_checked(self.fee),
-            serialize_nonce(self.nonce),
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.creator_id)
+        buf += self._creator_bytes
+        buf += serialize_content_hash(self.content_hash)
+        buf += self._recipient_bytes
+        buf += serialize_token_id(self.fee_token.id)
+        buf += packed_fee_checked(self.fee)
+        buf += serialize_nonce(self.nonce)
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         message = f"MintNFT {self.content_hash} for: {self.recipient.lower()}\nFee: {self.fee_token.decimal_str_amount(self.fee)} {self.fee_token.symbol}\nNonce: {self.nonce}"
-        return message
+        self._human_readable = message
+        return self._human_readable
 
     def dict(self):
         return {
@@ -546,8 +764,11 @@ class MintNFT(EncodedTx):
             "signature":          self.signature.dict(),
         }
 
-@dataclass
+@_message_dataclass
 class WithdrawNFT(EncodedTx):
+    _TX_TYPE: ClassVar[int] = 10
+    _HEADER: ClassVar[bytes] = bytes([0xff - _TX_TYPE, TRANSACTION_VERSION])
+
     account_id: int
     from_address: str
     to_address: str
@@ -559,27 +780,40 @@ class WithdrawNFT(EncodedTx):
     token_id: int
     signature: TxSignature = None
 
+    _encoded: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _human_readable: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _from_bytes: bytes = field(init=False, repr=False, compare=False)
+    _to_bytes: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._from_bytes = serialize_address(self.from_address)
+        self._to_bytes = serialize_address(self.to_address)
+
     def tx_type(self) -> int:
-        return 10
+        return self._TX_TYPE
 
     def encoded_message(self) -> bytes:
-        return b"".join([
-            int_to_bytes(0xff - self.tx_type(), 1),
-            int_to_bytes(TRANSACTION_VERSION, 1),
-            serialize_account_id(self.account_id),
-            serialize_address(self.from_address),
-            serialize_address(self.to_address),
-            serialize_token_id(self.token_id),
-            serialize_token_id(self.fee_token.id),
-            packed_fee_checked(self.fee),
-            serialize_nonce(self.nonce),
-            serialize_timestamp(self.valid_from),
-            serialize_timestamp(self.valid_until)
-        ])
+        if self._encoded is not None:
+            return self._encoded
+        buf = bytearray(self._HEADER)
+        buf += serialize_account_id(self.account_id)
+        buf += self._from_bytes
+        buf += self._to_bytes
+        buf += serialize_token_id(self.token_id)
+        buf += serialize_token_id(self.fee_token.id)
+        buf += packed_fee_checked(self.fee)
+        buf += serialize_nonce(self.nonce)
+        buf += serialize_timestamp(self.valid_from)
+        buf += serialize_timestamp(self.valid_until)
+        self._encoded = bytes(buf)
+        return self._encoded
 
     def human_readable_message(self) -> str:
+        if self._human_readable is not None:
+            return self._human_readable
         message = f"WithdrawNFT {self.token_id} to: {self.to_address.lower()}\nFee: {self.fee_token.decimal_str_amount(self.fee)} {self.fee_token.symbol}\nNonce: {self.nonce}"
-        return message
+        self._human_readable = message
+        return self._human_readable
 
     def dict(self):
         return {
@@ -596,7 +830,7 @@ class WithdrawNFT(EncodedTx):
             "signature":            self.signature.dict(),
         }
 
-@dataclass
+@dataclass(**_SLOTS)
 class TransactionWithSignature:
     tx: EncodedTx
     signature: TxEthSignature
@@ -370,7 +370,7 @@ class Wallet:
                       valid_from=valid_from,
                       valid_until=valid_until)
 
-        order.eth_signature = self.eth_signer.sign_tx(order)
+        order.ethSignature = self.eth_signer.sign_tx(order)
         order.signature = self.zk_signer.sign_tx(order)
 
         return order
@@ -421,7 +421,7 @@ class Wallet:
             )
 
         swap, eth_signature = await self.build_swap(orders, fee_token, amounts, fee, nonce)
-        eth_signatures = [eth_signature, swap.orders[0].eth_signature, swap.orders[1].eth_signature]
+        eth_signatures = [eth_signature, swap.orders[0].ethSignature, swap.orders[1].ethSignature]
         return await self.send_signed_transaction(swap, eth_signatures)
 
     # This function takes as a parameter the integer amount/fee of 
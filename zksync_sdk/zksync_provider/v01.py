@@ -26,12 +26,9 @@ class ZkSyncProviderV01(ZkSyncProviderInterface):
 
     async def get_tokens(self) -> Tokens:
         data = await self.provider.request("tokens", None)
-        tokens = [Token(address=Web3.toChecksumAddress(token['address']),
-                        id=token['id'],
-                        symbol=token['symbol'],
-                        decimals=token['decimals']
-                        ) for token in data.values()]
-        return Tokens(tokens=tokens)
+        for token in data.values():
+            token['address'] = Web3.toChecksumAddress(token['address'])
+        return Tokens.parse(data.values())
 
     async def submit_txs_batch(self, transactions: List[TransactionWithSignature],
                                signatures: Optional[